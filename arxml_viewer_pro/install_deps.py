@@ -4,11 +4,38 @@ ARXML Viewer Pro - Dependency Installation Script
 Installs required and optional dependencies for the application
 """
 
+import os
 import sys
+import argparse
+import tempfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import importlib
+import importlib.util
 from pathlib import Path
 
+# Dependency tables: (pip spec, package name, import name, description)
+_REQUIRED_PACKAGES = (
+    ("PyQt5>=5.15.0", "PyQt5", "PyQt5", "GUI framework"),
+    ("pydantic>=2.4.0", "pydantic", "pydantic", "Data validation"),
+    ("lxml>=4.9.3", "lxml", "lxml", "XML processing"),
+)
+
+_OPTIONAL_PACKAGES = (
+    ("loguru>=0.7.2", "loguru", "loguru", "Enhanced logging"),
+    ("pandas>=2.1.0", "pandas", "pandas", "Data analysis"),
+    ("matplotlib>=3.7.2", "matplotlib", "matplotlib", "Plotting"),
+    ("networkx>=3.1", "networkx", "networkx", "Graph algorithms"),
+    ("numpy>=1.24.0", "numpy", "numpy", "Numerical computing"),
+    ("Pillow>=10.0.0", "Pillow", "PIL", "Image processing"),
+    ("reportlab>=4.0.4", "reportlab", "reportlab", "PDF generation"),
+    ("click>=8.1.7", "click", "click", "Command line interface"),
+    ("numba>=0.58.0", "numba", "numba", "Performance optimization"),
+)
+
+_REQUIRED_SPECS = tuple(spec for spec, _, _, _ in _REQUIRED_PACKAGES)
+_OPTIONAL_SPECS = tuple(spec for spec, _, _, _ in _OPTIONAL_PACKAGES)
+
 def check_python_version():
     """Check if Python version is compatible"""
     if sys.version_info < (3, 9):
@@ -23,26 +50,90 @@ def install_package(package_name, description=""):
     """Install a single package"""
     try:
         print(f"📦 Installing {package_name}... {description}")
-        subprocess.check_call([
-            sys.executable, "-m", "pip", "install", package_name, "--upgrade"
-        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        _pip("install", package_name, "--upgrade")
         print(f"✅ {package_name} installed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print(f"❌ Failed to install {package_name}: {e}")
+        _print_pip_error(e)
         return False
 
+def _pip(*args):
+    """Run pip quietly in a subprocess (stderr is kept on the raised error)"""
+    subprocess.run(
+        [sys.executable, "-m", "pip", *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+        env={**os.environ, "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+    )
+
+def _print_pip_error(error):
+    """Show the tail of pip's stderr for a failed run"""
+    if error.stderr:
+        for line in error.stderr.strip().splitlines()[-5:]:
+            print(f"   {line}")
+
+def _download_parallel(package_specs, dest, parallel_jobs):
+    """Fetch wheels (with their dependencies) for each spec concurrently"""
+    def download(package_spec):
+        try:
+            _pip("download", "--dest", dest, package_spec)
+            return True
+        except subprocess.CalledProcessError:
+            return False
+    
+    with ThreadPoolExecutor(max_workers=min(parallel_jobs, len(package_specs))) as pool:
+        return all(pool.map(download, package_specs))
+
+def install_packages(package_specs, description="", parallel_jobs=1):
+    """Install several packages with a single pip run (one resolver pass)"""
+    print(f"📦 Installing {len(package_specs)} packages... {description}")
+    
+    if parallel_jobs > 1 and len(package_specs) > 1:
+        # Downloads are I/O bound - fetch them side by side, then install
+        # everything from the local wheel dir in one pass
+        with tempfile.TemporaryDirectory(prefix="arxml-wheels-") as wheel_dir:
+            if _download_parallel(package_specs, wheel_dir, parallel_jobs):
+                try:
+                    _pip("install", "--upgrade", "--no-index", "--find-links", wheel_dir, *package_specs)
+                    print(f"✅ {len(package_specs)} packages installed successfully")
+                    return True
+                except subprocess.CalledProcessError:
+                    pass
+        print("⚠️ Parallel download failed, falling back to a regular install")
+    
+    try:
+        _pip("install", "--upgrade", *package_specs)
+        print(f"✅ {len(package_specs)} packages installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Batch install failed: {e}")
+        _print_pip_error(e)
+        return False
+
+def _fast_check(module_name):
+    """Check a module is importable - already-loaded modules skip the finders"""
+    # find_spec only locates the package - no need to execute it (and load
+    # the Qt libraries) just to know pip put it on the path
+    return module_name in sys.modules or importlib.util.find_spec(module_name) is not None
+
 def verify_installation(module_name, package_name):
     """Verify that a package was installed correctly"""
-    try:
-        importlib.import_module(module_name)
+    if _fast_check(module_name):
         print(f"✅ {package_name} verified")
         return True
-    except ImportError:
-        print(f"❌ {package_name} verification failed")
-        return False
+    print(f"❌ {package_name} verification failed")
+    return False
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Install ARXML Viewer Pro dependencies")
+    parser.add_argument(
+        '--parallel-jobs', type=int, default=1, metavar='N',
+        help='Download packages with N concurrent pip processes (default: 1)'
+    )
+    return parser.parse_args()
 
-def main():
+def main(parallel_jobs=1):
     """Main installation function"""
     print("🔧 ARXML Viewer Pro - Dependency Installer")
     print("=" * 50)
@@ -51,42 +142,20 @@ def main():
     if not check_python_version():
         return False
     
-    # Required packages
-    required_packages = [
-        ("PyQt5>=5.15.0", "PyQt5", "GUI framework"),
-        ("pydantic>=2.4.0", "pydantic", "Data validation"),
-        ("lxml>=4.9.3", "lxml", "XML processing"),
-    ]
-    
-    # Optional packages
-    optional_packages = [
-        ("loguru>=0.7.2", "loguru", "Enhanced logging"),
-        ("pandas>=2.1.0", "pandas", "Data analysis"),
-        ("matplotlib>=3.7.2", "matplotlib", "Plotting"),
-        ("networkx>=3.1", "networkx", "Graph algorithms"),
-        ("numpy>=1.24.0", "numpy", "Numerical computing"),
-        ("Pillow>=10.0.0", "PIL", "Image processing"),
-        ("reportlab>=4.0.4", "reportlab", "PDF generation"),
-        ("click>=8.1.7", "click", "Command line interface"),
-        ("numba>=0.58.0", "numba", "Performance optimization"),
-    ]
-    
     print("\n📦 Installing required packages...")
-    required_success = True
-    
-    for package_spec, module_name, description in required_packages:
-        if not install_package(package_spec, description):
-            required_success = False
+    required_success = install_packages(_REQUIRED_SPECS, "Required packages", parallel_jobs)
     
     print("\n🔍 Verifying required installations...")
-    for package_spec, module_name, description in required_packages:
-        if not verify_installation(module_name, package_spec.split(">=")[0]):
+    # pip ran in a subprocess - drop stale path finder caches first
+    importlib.invalidate_caches()
+    for _, package_name, module_name, _ in _REQUIRED_PACKAGES:
+        if not verify_installation(module_name, package_name):
             required_success = False
     
     if not required_success:
         print("\n❌ Some required packages failed to install")
         print("Please install manually:")
-        for package_spec, _, _ in required_packages:
+        for package_spec in _REQUIRED_SPECS:
             print(f"  pip install {package_spec}")
         return False
     
@@ -100,12 +169,19 @@ def main():
         print("\n📦 Installing optional packages...")
         optional_success = 0
         
-        for package_spec, module_name, description in optional_packages:
-            if install_package(package_spec, description):
-                if verify_installation(module_name, package_spec.split(">=")[0]):
-                    optional_success += 1
+        # One pip run for the whole set; if any package can't be installed
+        # (e.g. no wheel for this Python) fall back to installing one by one
+        # so the rest still go in
+        if not install_packages(_OPTIONAL_SPECS, "Optional packages", parallel_jobs):
+            for package_spec, _, _, description in _OPTIONAL_PACKAGES:
+                install_package(package_spec, description)
+        
+        importlib.invalidate_caches()
+        for _, package_name, module_name, _ in _OPTIONAL_PACKAGES:
+            if verify_installation(module_name, package_name):
+                optional_success += 1
         
-        print(f"\n✅ {optional_success}/{len(optional_packages)} optional packages installed")
+        print(f"\n✅ {optional_success}/{len(_OPTIONAL_PACKAGES)} optional packages installed")
     
     print("\n🎉 Installation complete!")
     print("\nYou can now run the application with:")
@@ -117,7 +193,8 @@ def main():
 
 if __name__ == "__main__":
     try:
-        success = main()
+        args = parse_arguments()
+        success = main(parallel_jobs=args.parallel_jobs)
         sys.exit(0 if success else 1)
     except KeyboardInterrupt:
         print("\n\n⚠️ Installation cancelled by user")
@@ -9,18 +9,8 @@ import os
 import tempfile
 from pathlib import Path
 
-def setup_path():
-    """Setup Python path"""
-    project_root = Path(__file__).parent
-    src_path = project_root / "src"
-    if src_path.exists() and str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
-        return True
-    return False
-
-def create_test_arxml():
-    """Create a simple test ARXML file"""
-    test_content = '''<?xml version="1.0" encoding="UTF-8"?>
+# Sample ARXML used by the parser test, built once at import
+_TEST_ARXML = '''<?xml version="1.0" encoding="UTF-8"?>
 <AUTOSAR xmlns="http://autosar.org/schema/r4.0">
   <AR-PACKAGES>
     <AR-PACKAGE>
@@ -41,11 +31,33 @@ def create_test_arxml():
     </AR-PACKAGE>
   </AR-PACKAGES>
 </AUTOSAR>'''
-    
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.arxml', delete=False) as f:
-        f.write(test_content)
-        return f.name
+_TEST_ARXML_BYTES = _TEST_ARXML.encode('utf-8')
+
+# Source directory, resolved once from this script's location
+_SRC = Path(__file__).resolve().parent / "src"
+# Paths already ensured on sys.path by this module
+_added_paths = set()
+
+def setup_path():
+    """Setup Python path"""
+    if not _SRC.is_dir():
+        return False
+    src_path = str(_SRC)
+    if src_path not in _added_paths:
+        if src_path not in sys.path:
+            sys.path.insert(0, src_path)
+        _added_paths.add(src_path)
+    return True
+
+def create_test_arxml():
+    """Create a simple test ARXML file"""
+    # Create temporary file - one raw write, no buffered file object needed
+    fd, path = tempfile.mkstemp(suffix='.arxml')
+    try:
+        os.write(fd, _TEST_ARXML_BYTES)
+    finally:
+        os.close(fd)
+    return path
 
 def test_imports():
     """Test that core modules can be imported"""
@@ -259,24 +271,25 @@ def test_services():
         print(f"❌ Services test failed: {e}")
         return False
 
+# Test table, in run order
+_TESTS = (
+    ("Import Test", test_imports),
+    ("Model Test", test_models),
+    ("Parser Test", test_parser),
+    ("Config Test", test_config),
+    ("GUI Test", test_gui_imports),
+    ("Services Test", test_services),
+)
+
 def run_all_tests():
     """Run all tests"""
     print("🧪 ARXML Viewer Pro - Quick Test Suite")
     print("=" * 45)
     
-    tests = [
-        ("Import Test", test_imports),
-        ("Model Test", test_models),
-        ("Parser Test", test_parser),
-        ("Config Test", test_config),
-        ("GUI Test", test_gui_imports),
-        ("Services Test", test_services)
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    for test_name, test_func in _TESTS:
         print(f"\n📋 {test_name}")
         print("-" * 30)
         
@@ -6,54 +6,48 @@ Handles Python path setup and launches the application with better error handlin
 
 import sys
 import os
+import importlib
+import importlib.util
 from pathlib import Path
 
+# Project layout, resolved once from this script's location (independent of cwd)
+_SRC = Path(__file__).resolve().parent / "src"
+# Paths already ensured on sys.path by this module
+_added_paths = set()
+
+# Import names probed by check_dependencies
+_REQUIRED_DEPS = ('PyQt5', 'pydantic', 'lxml')
+_OPTIONAL_DEPS = ('loguru', 'pandas', 'matplotlib', 'networkx')
+
 def setup_python_path():
     """Setup Python path for the application"""
-    # Get the project root directory
-    project_root = Path.cwd()
-    src_path = project_root / "src"
-    
-    if not src_path.exists():
-        print(f"❌ Source directory not found: {src_path}")
-        print(f"Current directory: {project_root}")
-        print("Make sure you're running from the arxml_viewer_pro directory")
+    if not _SRC.is_dir():
+        print(f"❌ Source directory not found: {_SRC}")
+        print("Make sure run_app.py is inside the arxml_viewer_pro directory")
         return False
     
-    # Add src to Python path
-    if str(src_path) not in sys.path:
-        sys.path.insert(0, str(src_path))
-        print(f"✅ Added to Python path: {src_path}")
+    # Add src to Python path - repeat calls hit the set, not a sys.path scan
+    src_path = str(_SRC)
+    if src_path not in _added_paths:
+        if src_path not in sys.path:
+            sys.path.insert(0, src_path)
+            print(f"✅ Added to Python path: {src_path}")
+        _added_paths.add(src_path)
     
     return True
 
+def _fast_check(module_name):
+    """Check a module is importable - already-loaded modules skip the finders"""
+    # find_spec only locates the package, it does not execute it (PyQt5
+    # import alone loads the Qt libraries)
+    return module_name in sys.modules or importlib.util.find_spec(module_name) is not None
+
 def check_dependencies():
     """Check if required dependencies are available"""
     print("🔍 Checking dependencies...")
     
-    required_deps = ['PyQt5', 'pydantic', 'lxml']
-    optional_deps = ['loguru', 'pandas', 'matplotlib', 'networkx']
-    
-    missing_required = []
-    missing_optional = []
-    
-    # Check required dependencies
-    for dep in required_deps:
-        try:
-            __import__(dep)
-            print(f"✅ {dep}")
-        except ImportError:
-            print(f"❌ {dep} - MISSING (REQUIRED)")
-            missing_required.append(dep)
-    
-    # Check optional dependencies
-    for dep in optional_deps:
-        try:
-            __import__(dep)
-            print(f"✅ {dep}")
-        except ImportError:
-            print(f"⚠️ {dep} - MISSING (OPTIONAL)")
-            missing_optional.append(dep)
+    missing_required = [dep for dep in _REQUIRED_DEPS if not _fast_check(dep)]
+    missing_optional = [dep for dep in _OPTIONAL_DEPS if not _fast_check(dep)]
     
     if missing_required:
         print(f"\n❌ Missing required dependencies: {missing_required}")
@@ -64,6 +58,8 @@ def check_dependencies():
         print(f"\n⚠️ Missing optional dependencies: {missing_optional}")
         print("Application will run with reduced functionality.")
         print("Install with: pip install loguru pandas matplotlib networkx")
+    else:
+        print("✅ All dependencies available")
     
     return True
 
@@ -74,9 +70,18 @@ def install_missing_dependencies():
     try:
         import subprocess
         
-        # Install basic required packages
+        # Install basic required packages - one pip run, one resolver pass
         packages = ["PyQt5>=5.15.0", "pydantic>=2.4.0", "lxml>=4.9.3"]
         
+        try:
+            print(f"Installing {', '.join(packages)}...")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", *packages])
+            print("✅ Packages installed")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️ Combined install failed ({e}), retrying one package at a time...")
+        
+        # Retry individually so the failing package is identified
         for package in packages:
             try:
                 print(f"Installing {package}...")
@@ -126,13 +131,7 @@ def main():
     print("🔧 ARXML Viewer Pro Launcher - FIXED VERSION")
     print("=" * 50)
     
-    # Check we're in the right directory
-    if not Path("src").exists():
-        print("❌ Please run this script from the arxml_viewer_pro directory")
-        print("Current directory:", Path.cwd())
-        return False
-    
-    # Setup Python path
+    # Setup Python path (reports a missing src directory itself)
     if not setup_python_path():
         return False
     
@@ -144,6 +143,9 @@ def main():
         if choice == 'y':
             if install_missing_dependencies():
                 print("✅ Dependencies installed. Restarting dependency check...")
+                # Path finders cache directory listings; drop them so
+                # find_spec sees the freshly installed packages
+                importlib.invalidate_caches()
                 if not check_dependencies():
                     print("❌ Dependency installation incomplete. Please install manually.")
                     return False
@@ -163,7 +165,7 @@ def main():
     else:
         print("\n❌ Application encountered errors")
         print("\n🔍 Troubleshooting tips:")
-        print("1. Make sure you're in the arxml_viewer_pro directory")
+        print("1. Make sure run_app.py is inside the arxml_viewer_pro directory (next to src/)")
         print("2. Install missing dependencies: pip install PyQt5 pydantic lxml loguru")
         print("3. Try running: python -m arxml_viewer.main")
         print("4. Check if PyQt5 is properly installed: python -c 'import PyQt5; print(\"PyQt5 OK\")'")
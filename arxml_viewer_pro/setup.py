@@ -4,7 +4,7 @@ ARXML Viewer Pro - Setup Configuration
 Professional AUTOSAR ARXML file viewer for automotive engineers
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 def read_readme():
@@ -15,7 +15,9 @@ def read_readme():
 
 def read_requirements():
     with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+        # Strip each line once, then filter
+        stripped = (line.strip() for line in fh)
+        return [line for line in stripped if line and not line.startswith("#")]
 
 setup(
     name="arxml-viewer-pro",
@@ -41,7 +43,19 @@ setup(
         "Environment :: X11 Applications :: Qt",
     ],
     package_dir={"": "src"},
-    packages=find_packages(where="src"),
+    # Listed explicitly: no tree walk, and core/models/parsers/gui have no
+    # __init__.py so find_packages() would leave them out of the install
+    packages=[
+        "arxml_viewer",
+        "arxml_viewer.core",
+        "arxml_viewer.gui",
+        "arxml_viewer.gui.graphics",
+        "arxml_viewer.gui.widgets",
+        "arxml_viewer.models",
+        "arxml_viewer.parsers",
+        "arxml_viewer.services",
+        "arxml_viewer.utils",
+    ],
     python_requires=">=3.9",
     install_requires=read_requirements(),
     extras_require={
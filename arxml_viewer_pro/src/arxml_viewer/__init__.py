@@ -11,29 +11,36 @@ __author__ = "Jayadev Meka"
 __email__ = "jd@miraiflow.tech"
 __description__ = "Professional AUTOSAR ARXML file viewer for automotive engineers"
 
-# Import only essential components that exist and work
-try:
-    from .parsers.arxml_parser import ARXMLParser
-    from .models.component import Component, ComponentType
-    from .models.port import Port, PortType
-    from .models.connection import Connection
-    from .models.package import Package
-    from .config import ConfigManager
-    
-    __all__ = [
-        "ARXMLParser", 
-        "Component",
-        "ComponentType",
-        "Port",
-        "PortType", 
-        "Connection",
-        "Package",
-        "ConfigManager",
-    ]
-    
-    print("✅ ARXML Viewer Pro core components loaded successfully")
+# Public names are resolved lazily (PEP 562) - importing the package (e.g. for
+# ``python -m arxml_viewer.main --help``) doesn't pull in lxml/pydantic until
+# one of these is actually used
+_LAZY_IMPORTS = {
+    "ARXMLParser": ".parsers.arxml_parser",
+    "Component": ".models.component",
+    "ComponentType": ".models.component",
+    "Port": ".models.port",
+    "PortType": ".models.port",
+    "Connection": ".models.connection",
+    "Package": ".models.package",
+    "ConfigManager": ".config",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Resolvable by explicit import only - kept out of __all__/dir() so star imports
+# and introspection (pydoc, inspect) don't pull in the Qt stack
+_LAZY_IMPORTS["ARXMLViewerApplication"] = ".core.application"
+
+def __getattr__(name):
+    """Import public components on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-except ImportError as e:
-    # If core components fail to import, provide minimal fallback
-    print(f"⚠️ Some core components failed to import: {e}")
-    __all__ = []
\ No newline at end of file
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,13 @@ Application Configuration - Centralized configuration management
 """
 
 import os
-import json
+import atexit
+import functools
+import threading
+import weakref
 from pathlib import Path
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from loguru import logger
 
 class AppConfig(BaseModel):
@@ -42,9 +45,39 @@ class AppConfig(BaseModel):
     default_export_format: str = "PNG"
     export_quality: int = 300  # DPI for raster exports
     
-    class Config:
-        """Pydantic configuration"""
-        validate_assignment = True
+    model_config = ConfigDict(validate_assignment=True)
+
+# Validated once; a fresh config is a copy of this rather than a new build
+_DEFAULT_CONFIG = AppConfig()
+
+def _default_config() -> AppConfig:
+    """Fresh default configuration (deep copy so recent_files isn't shared)"""
+    return _DEFAULT_CONFIG.model_copy(deep=True)
+
+# Coalesce bursts of config changes (e.g. several files opened) into one write
+SAVE_DELAY_SECONDS = 1.0
+
+# Managers with a possibly pending save - weak so exit handling doesn't keep them alive
+_live_managers = weakref.WeakSet()
+
+@atexit.register
+def _flush_pending_saves() -> None:
+    """Write out changes still waiting on their save timer at interpreter exit"""
+    for manager in list(_live_managers):
+        manager.flush()
+
+@functools.lru_cache(maxsize=None)
+def _get_default_config_dir() -> Path:
+    """Platform-appropriate config directory (resolved once per process)"""
+    if os.name == 'nt':  # Windows
+        return Path.home() / "AppData" / "Local" / "ARXMLViewerPro"
+    # Unix-like
+    return Path.home() / ".config" / "arxml-viewer-pro"
+
+def _normalize_recent_path(file_path: str) -> str:
+    """Recent-files key: absolute, normalized, case-folded where the OS is
+    case-insensitive. Purely lexical - no per-component stat like resolve()"""
+    return os.path.normcase(os.path.abspath(file_path))
 
 class ConfigManager:
     """Manages application configuration persistence"""
@@ -53,40 +86,73 @@ class ConfigManager:
         if config_dir:
             self.config_dir = Path(config_dir)
         else:
-            # Use platform-appropriate config directory
-            if os.name == 'nt':  # Windows
-                self.config_dir = Path.home() / "AppData" / "Local" / "ARXMLViewerPro"
-            else:  # Unix-like
-                self.config_dir = Path.home() / ".config" / "arxml-viewer-pro"
+            self.config_dir = _get_default_config_dir()
         
         self.config_file = self.config_dir / "config.json"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
+        # Last content written to config_file - lets save_config skip no-op writes
+        self._saved_content: Optional[str] = None
+        
+        # Deferred save state - changes are flushed by a timer or at exit
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_pending = False
+        _live_managers.add(self)
+        
         self._config = self.load_config()
     
     def load_config(self) -> AppConfig:
         """Load configuration from file or create default"""
         try:
-            if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                return AppConfig(**config_data)
-            else:
-                logger.info("No config file found, creating default configuration")
-                return AppConfig()
+            content = self.config_file.read_text(encoding='utf-8')
+            config = AppConfig.model_validate_json(content)
+            self._saved_content = content
+            return config
+        except FileNotFoundError:
+            logger.info("No config file found, creating default configuration")
+            return _default_config()
         except Exception as e:
             logger.warning(f"Failed to load config: {e}, using default")
-            return AppConfig()
+            return _default_config()
     
     def save_config(self) -> bool:
         """Save current configuration to file"""
-        try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config.dict(), f, indent=2)
-            return True
-        except Exception as e:
-            logger.error(f"Failed to save config: {e}")
-            return False
+        with self._save_lock:
+            try:
+                content = self._config.model_dump_json()
+                if content == self._saved_content:
+                    return True
+                # Write a temp file and swap it in so a crash can't leave a truncated config
+                tmp_file = self.config_file.with_suffix('.json.tmp')
+                tmp_file.write_text(content, encoding='utf-8')
+                os.replace(tmp_file, self.config_file)
+                self._saved_content = content
+                return True
+            except Exception as e:
+                logger.error(f"Failed to save config: {e}")
+                return False
+    
+    def schedule_save(self) -> None:
+        """Save after SAVE_DELAY_SECONDS, restarting the delay on each call"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+            self._save_pending = True
+    
+    def flush(self) -> bool:
+        """Write any pending changes now - a no-op if nothing changed"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._save_pending:
+                return True
+            self._save_pending = False
+        return self.save_config()
     
     @property
     def config(self) -> AppConfig:
@@ -94,32 +160,28 @@ class ConfigManager:
         return self._config
     
     def update_config(self, **kwargs) -> None:
-        """Update configuration values"""
+        """Update configuration values - only schedules a save if something changed"""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(self._config, key):
+            if hasattr(self._config, key) and getattr(self._config, key) != value:
                 setattr(self._config, key, value)
-        self.save_config()
+                changed = True
+        if changed:
+            self.schedule_save()
     
     def add_recent_file(self, file_path: str) -> None:
         """Add file to recent files list"""
-        file_path = str(Path(file_path).resolve())
-        
-        # Remove if already exists
-        if file_path in self._config.recent_files:
-            self._config.recent_files.remove(file_path)
-        
-        # Add to beginning
-        self._config.recent_files.insert(0, file_path)
+        file_path = _normalize_recent_path(file_path)
         
-        # Limit size
-        if len(self._config.recent_files) > self._config.max_recent_files:
-            self._config.recent_files = self._config.recent_files[:self._config.max_recent_files]
+        # Move to the front (dropping any older entry) and limit size in one rebuild
+        recent = dict.fromkeys([file_path, *self._config.recent_files])
+        self._config.recent_files = list(recent)[:self._config.max_recent_files]
         
-        self.save_config()
+        self.schedule_save()
     
     def remove_recent_file(self, file_path: str) -> None:
         """Remove file from recent files list"""
-        file_path = str(Path(file_path).resolve())
+        file_path = _normalize_recent_path(file_path)
         if file_path in self._config.recent_files:
             self._config.recent_files.remove(file_path)
-            self.save_config()
\ No newline at end of file
+            self.schedule_save()
\ No newline at end of file
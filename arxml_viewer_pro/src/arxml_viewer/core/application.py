@@ -5,10 +5,11 @@ Removed all references to deleted modules and complex features
 MAJOR SIMPLIFICATION: Direct parsing, basic signals only
 """
 
+import os
 import sys
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any
 from pathlib import Path
-from PyQt5.QtWidgets import QMainWindow, QMessageBox
 from PyQt5.QtCore import pyqtSignal, QObject
 
 from ..parsers.arxml_parser import ARXMLParser, ARXMLParsingError
@@ -18,6 +19,9 @@ from ..config import ConfigManager
 from ..utils.logger import get_logger
 from ..utils.constants import AppConstants
 
+# Parse results kept for recently opened files (re-opening skips the parser)
+PARSE_CACHE_SIZE = 4
+
 class ARXMLViewerApplication(QObject):
     """
     SIMPLIFIED main application controller
@@ -32,7 +36,8 @@ class ARXMLViewerApplication(QObject):
     parsing_finished = pyqtSignal(list, dict)  # packages, metadata
     parsing_failed = pyqtSignal(str)
     
-    def __init__(self, config_manager: ConfigManager, show_splash: bool = True):
+    def __init__(self, config_manager: ConfigManager, show_splash: bool = True,
+                 gui_enabled: bool = True):
         super().__init__()
         
         self.logger = get_logger(__name__)
@@ -47,8 +52,11 @@ class ARXMLViewerApplication(QObject):
         # Basic parser - no threading
         self.parser = ARXMLParser()
         
-        # Create the main window
-        self.main_window = self._create_main_window()
+        # (path, mtime_ns, size) -> (packages, metadata, connections), LRU order
+        self._parse_cache: OrderedDict = OrderedDict()
+        
+        # Create the main window (headless use - scripts, tests - skips the GUI)
+        self.main_window = self._create_main_window() if gui_enabled else None
         
         # Basic setup
         if self.main_window:
@@ -104,15 +112,16 @@ class ARXMLViewerApplication(QObject):
         SIMPLIFIED file opening - direct parsing, no threading
         Enhanced to get connections but with error handling
         """
-        from pathlib import Path
-        
-        file_path = str(Path(file_path).resolve())
+        file_path = os.path.realpath(file_path)
         print(f"🔧 Opening file: {file_path}")
         
-        # Simple validation
-        if not Path(file_path).exists():
+        # Simple validation - one stat serves the existence check and cache key
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             print(f"❌ File not found: {file_path}")
             return False
+        cache_key = (file_path, stat.st_mtime_ns, stat.st_size)
         
         # Close current file if open
         if self.current_file:
@@ -122,23 +131,35 @@ class ARXMLViewerApplication(QObject):
         self.parsing_started.emit(file_path)
         
         try:
-            print("🔧 Starting parser...")
-            # Direct parsing - no threading complexity
-            packages, metadata = self.parser.parse_file(file_path)
-            print(f"✅ Parsed {len(packages)} packages")
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                # Unchanged since it was last parsed - reuse the result
+                self._parse_cache.move_to_end(cache_key)
+                packages, metadata, connections = cached
+                print(f"✅ Reusing {len(packages)} parsed packages")
+            else:
+                print("🔧 Starting parser...")
+                # Direct parsing - no threading complexity
+                packages, metadata = self.parser.parse_file(file_path)
+                print(f"✅ Parsed {len(packages)} packages")
+                
+                # Get parsed connections with error handling
+                try:
+                    connections = self.parser.get_parsed_connections()
+                    print(f"🔗 Retrieved {len(connections)} connections")
+                except Exception as e:
+                    print(f"⚠️ Connection retrieval failed: {e}")
+                    connections = []
+                
+                self._parse_cache[cache_key] = (packages, metadata, connections)
+                if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
             
             # Store results
             self.current_file = file_path
             self.current_packages = packages
             self.current_metadata = metadata
-            
-            # Get parsed connections with error handling
-            try:
-                self.current_connections = self.parser.get_parsed_connections()
-                print(f"🔗 Retrieved {len(self.current_connections)} connections")
-            except Exception as e:
-                print(f"⚠️ Connection retrieval failed: {e}")
-                self.current_connections = []
+            self.current_connections = list(connections)
             
             # Add to recent files
             try:
@@ -155,8 +176,7 @@ class ARXMLViewerApplication(QObject):
             
         except Exception as e:
             print(f"❌ Parsing failed: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception("Parsing failed for {}", file_path)
             self.parsing_failed.emit(str(e))
             return False
     
@@ -227,6 +247,8 @@ class ARXMLViewerApplication(QObject):
                         'height': geometry.height()
                     }
                 )
+            # Write now rather than waiting for the deferred save
+            self.config_manager.flush()
         except Exception as e:
             self.logger.error(f"Save configuration failed: {e}")
     
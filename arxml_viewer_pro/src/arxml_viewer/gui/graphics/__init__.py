@@ -18,7 +18,6 @@ try:
     from PyQt5.QtCore import Qt, QPointF, QRectF
     from PyQt5.QtGui import QPolygonF, QPen, QBrush, QColor
     QT_GRAPHICS_AVAILABLE = True
-    print("✅ Qt Graphics components imported successfully")
 except ImportError as e:
     print(f"⚠️ Qt Graphics imports failed: {e}")
     QT_GRAPHICS_AVAILABLE = False
@@ -69,7 +68,6 @@ except ImportError as e:
 try:
     from .graphics_scene import ComponentDiagramScene, ComponentGraphicsItem
     GRAPHICS_SCENE_AVAILABLE = True
-    print("✅ Graphics scene components imported")
 except ImportError as e:
     print(f"⚠️ Graphics scene import failed: {e}")
     GRAPHICS_SCENE_AVAILABLE = False
@@ -99,7 +97,6 @@ except ImportError as e:
 try:
     from .connection_graphics import ConnectionManager, ConnectionGraphicsItem
     CONNECTION_GRAPHICS_AVAILABLE = True
-    print("✅ Connection graphics components imported")
 except ImportError as e:
     print(f"⚠️ Connection graphics import failed: {e}")
     CONNECTION_GRAPHICS_AVAILABLE = False
@@ -155,7 +152,6 @@ except ImportError as e:
 try:
     from .port_graphics import EnhancedPortGraphicsItem
     ENHANCED_PORTS_AVAILABLE = True
-    print("✅ Enhanced port graphics components imported")
 except ImportError as e:
     print(f"⚠️ Enhanced port graphics import failed: {e}")
     ENHANCED_PORTS_AVAILABLE = False
@@ -186,7 +182,3 @@ __all__ = [
     'GRAPHICS_SCENE_AVAILABLE', 'CONNECTION_GRAPHICS_AVAILABLE', 'ENHANCED_PORTS_AVAILABLE',
     'QT_GRAPHICS_AVAILABLE'
 ]
-
-print(f"🔧 Graphics module initialized - QT_GRAPHICS: {QT_GRAPHICS_AVAILABLE}, "
-      f"SCENE: {GRAPHICS_SCENE_AVAILABLE}, CONNECTIONS: {CONNECTION_GRAPHICS_AVAILABLE}, "
-      f"PORTS: {ENHANCED_PORTS_AVAILABLE}")
\ No newline at end of file
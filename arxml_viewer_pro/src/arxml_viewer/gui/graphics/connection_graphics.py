@@ -210,7 +210,7 @@ class ConnectionManager:
             # Store in SIMPLE list
             self.connection_items.append(connection_item)
             
-            self.logger.debug(f"Added simple connection: {getattr(connection, 'short_name', 'Unknown')}")
+            self.logger.debug("Added simple connection: {}", getattr(connection, 'short_name', 'Unknown'))
             return connection_item
             
         except Exception as e:
@@ -230,7 +230,7 @@ class ConnectionManager:
             # Remove from SIMPLE list
             self.connection_items.remove(connection_item)
             
-            self.logger.debug(f"Removed simple connection")
+            self.logger.debug("Removed simple connection")
             
         except Exception as e:
             self.logger.error(f"Failed to remove simple connection: {e}")
@@ -261,7 +261,7 @@ class ConnectionManager:
                 except Exception as e:
                     self.logger.warning(f"Failed to update simple connection: {e}")
             
-            self.logger.debug(f"Updated {updated_count} simple connections")
+            self.logger.debug("Updated {} simple connections", updated_count)
             
         except Exception as e:
             self.logger.error(f"Simple connection update failed: {e}")
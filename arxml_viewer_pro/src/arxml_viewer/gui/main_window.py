@@ -607,27 +607,21 @@ class MainWindow(QMainWindow):
         try:
             self.tree_widget.clear()
             
+            # Build the items detached from the view, then insert them in one call
+            package_items = []
             for package in packages:
                 # Create package item
-                pkg_item = QTreeWidgetItem(self.tree_widget)
+                pkg_item = QTreeWidgetItem()
                 pkg_item.setText(0, f"📁 {package.short_name}")
+                package_items.append(pkg_item)
                 
                 # Add components
                 for component in package.components:
                     comp_item = QTreeWidgetItem(pkg_item)
                     
                     # Component icon based on type
-                    if hasattr(component, 'component_type'):
-                        if component.component_type.name == 'APPLICATION':
-                            icon = "📱"
-                        elif component.component_type.name == 'COMPOSITION':
-                            icon = "📦"
-                        elif component.component_type.name == 'SERVICE':
-                            icon = "🔧"
-                        else:
-                            icon = "⚙️"
-                    else:
-                        icon = "⚙️"
+                    type_name = component.component_type.name if hasattr(component, 'component_type') else None
+                    icon = AppConstants.COMPONENT_ICONS.get(type_name, AppConstants.DEFAULT_COMPONENT_ICON)
                     
                     comp_item.setText(0, f"{icon} {component.short_name}")
                     
@@ -637,9 +631,16 @@ class MainWindow(QMainWindow):
                             port_item = QTreeWidgetItem(comp_item)
                             port_symbol = "🟢" if hasattr(port, 'is_provided') and port.is_provided else "🔴"
                             port_item.setText(0, f"{port_symbol} {port.short_name}")
+            
+            self.tree_widget.setUpdatesEnabled(False)
+            try:
+                self.tree_widget.addTopLevelItems(package_items)
                 
-                # Expand first level
-                pkg_item.setExpanded(True)
+                # Expand first level (only takes effect once items are in the view)
+                for pkg_item in package_items:
+                    pkg_item.setExpanded(True)
+            finally:
+                self.tree_widget.setUpdatesEnabled(True)
             
             print(f"✅ Loaded {len(packages)} packages into basic tree")
             
@@ -17,6 +17,8 @@ from ...utils.logger import get_logger
 class BreadcrumbItem:
     """Represents a single breadcrumb item"""
     
+    __slots__ = ('name', 'display_name', 'item_type', 'item_uuid', 'tooltip')
+    
     def __init__(self, name: str, display_name: str = None, item_type: str = "component", 
                  item_uuid: str = None, tooltip: str = None):
         self.name = name
@@ -216,7 +218,7 @@ class BreadcrumbWidget(QWidget):
                 if breadcrumb_item.item_uuid:
                     self.navigation_requested.emit(breadcrumb_item.item_type, breadcrumb_item.item_uuid)
                 
-                self.logger.debug(f"Navigated to: {breadcrumb_item.name}")
+                self.logger.debug("Navigated to: {}", breadcrumb_item.name)
             
         except Exception as e:
             self.logger.error(f"Navigation failed: {e}")
@@ -245,7 +247,7 @@ class BreadcrumbWidget(QWidget):
                 self.breadcrumb_items = [self.breadcrumb_items[0]] + self.breadcrumb_items[-(self.max_visible_items-1):]
             
             self._rebuild_breadcrumbs()
-            self.logger.debug(f"Added breadcrumb: {name}")
+            self.logger.debug("Added breadcrumb: {}", name)
             
         except Exception as e:
             self.logger.error(f"Failed to add breadcrumb: {e}")
@@ -266,7 +268,7 @@ class BreadcrumbWidget(QWidget):
                 self.breadcrumb_items.append(breadcrumb_item)
             
             self._rebuild_breadcrumbs()
-            self.logger.debug(f"Set breadcrumb path with {len(path_items)} items")
+            self.logger.debug("Set breadcrumb path with {} items", len(path_items))
             
         except Exception as e:
             self.logger.error(f"Failed to set breadcrumb path: {e}")
@@ -369,7 +371,7 @@ class BreadcrumbWidget(QWidget):
                     if current_item.item_uuid:
                         self.navigation_requested.emit(current_item.item_type, current_item.item_uuid)
                 
-                self.logger.debug(f"Navigated back from: {removed_item.name}")
+                self.logger.debug("Navigated back from: {}", removed_item.name)
                 return True
             return False
         except Exception as e:
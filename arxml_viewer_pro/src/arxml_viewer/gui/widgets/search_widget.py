@@ -4,7 +4,8 @@ Search Widget - Advanced search and filtering interface
 Provides comprehensive search functionality with auto-complete and filtering
 """
 
-from typing import List, Dict, Optional, Any
+from collections import deque
+from typing import Deque, List, Dict, Optional, Any
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, 
     QComboBox, QLabel, QFrame, QCompleter, QListWidget, QListWidgetItem,
@@ -73,7 +74,7 @@ class SearchResultsWidget(QListWidget):
         
         # Show result count
         if results:
-            self.logger.debug(f"Displaying {len(results)} search results")
+            self.logger.debug("Displaying {} search results", len(results))
     
     def _add_result_item(self, result: SearchResult):
         """Add a search result item to the list"""
@@ -313,7 +314,8 @@ class AdvancedSearchWidget(QWidget):
         
         # Search state
         self.current_results: List[SearchResult] = []
-        self.search_history: List[str] = []
+        # Most recent first, bounded so old queries fall off the end
+        self.search_history: Deque[str] = deque(maxlen=20)
         
         # Setup UI
         self._setup_ui()
@@ -538,7 +540,7 @@ class AdvancedSearchWidget(QWidget):
             
             self.search_completed.emit(results)
             
-            self.logger.debug(f"Search completed: '{query}' -> {len(results)} results")
+            self.logger.debug("Search completed: '{}' -> {} results", query, len(results))
             
         except Exception as e:
             self.logger.error(f"Search failed: {e}")
@@ -576,15 +578,11 @@ class AdvancedSearchWidget(QWidget):
         if query in self.search_history:
             self.search_history.remove(query)
         
-        self.search_history.insert(0, query)
-        
-        # Limit history size
-        if len(self.search_history) > 20:
-            self.search_history = self.search_history[:20]
+        self.search_history.appendleft(query)
     
     def _update_completer(self):
         """Update auto-completer with search history and suggestions"""
-        suggestions = self.search_history.copy()
+        suggestions = list(self.search_history)
         
         # Add search engine suggestions
         current_text = self.search_input.text().strip()
@@ -593,14 +591,7 @@ class AdvancedSearchWidget(QWidget):
             suggestions.extend(engine_suggestions)
         
         # Remove duplicates while preserving order
-        unique_suggestions = []
-        seen = set()
-        for suggestion in suggestions:
-            if suggestion not in seen:
-                unique_suggestions.append(suggestion)
-                seen.add(suggestion)
-        
-        self.completer_model.setStringList(unique_suggestions)
+        self.completer_model.setStringList(list(dict.fromkeys(suggestions)))
     
     def set_search_engine(self, search_engine: SearchEngine):
         """Set the search engine to use"""
@@ -11,7 +11,7 @@ from PyQt5.QtWidgets import (
     QLineEdit, QVBoxLayout, QWidget, QHBoxLayout, QPushButton,
     QComboBox, QLabel, QFrame, QToolButton, QApplication
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QMimeData, QUrl
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QMimeData, QUrl
 from PyQt5.QtGui import QIcon, QFont, QBrush, QColor, QDrag, QPainter
 
 from ...models.component import Component, ComponentType
@@ -27,6 +27,13 @@ class TreeItemType:
     PORT = "port"
     FOLDER = "folder"
 
+# Filter combo labels -> the only item type left visible
+FILTER_ITEM_TYPES = {
+    "Components Only": TreeItemType.COMPONENT,
+    "Ports Only": TreeItemType.PORT,
+    "Packages Only": TreeItemType.PACKAGE,
+}
+
 class EnhancedTreeWidgetItem(QTreeWidgetItem):
     """Enhanced tree widget item with additional functionality - FIXED VERSION"""
     
@@ -133,14 +140,8 @@ class EnhancedTreeWidgetItem(QTreeWidgetItem):
             # For now, use text indicators
             # Icons can be added later when icon resources are available
             if isinstance(self.data_object, Component):
-                if self.data_object.component_type == ComponentType.APPLICATION:
-                    self.setText(0, f"📱 {self.data_object.short_name}")
-                elif self.data_object.component_type == ComponentType.COMPOSITION:
-                    self.setText(0, f"📦 {self.data_object.short_name}")
-                elif self.data_object.component_type == ComponentType.SERVICE:
-                    self.setText(0, f"🔧 {self.data_object.short_name}")
-                else:
-                    self.setText(0, f"⚙️ {self.data_object.short_name}")
+                icon = AppConstants.COMPONENT_ICONS.get(self.data_object.component_type.name, AppConstants.DEFAULT_COMPONENT_ICON)
+                self.setText(0, f"{icon} {self.data_object.short_name}")
             
             elif isinstance(self.data_object, Port):
                 if self.data_object.is_provided:
@@ -314,25 +315,30 @@ class TreeSearchWidget(QWidget):
             }
         """)
     
+    @pyqtSlot(str)
     def _on_search_changed(self, text: str):
         """Handle search input change with delay"""
         self.search_timer.stop()
         self.search_timer.start(300)  # 300ms delay
     
+    @pyqtSlot()
     def _emit_search_changed(self):
         """Emit search changed signal"""
         text = self.search_input.text().strip()
         self.search_changed.emit(text)
     
+    @pyqtSlot()
     def _on_search_submitted(self):
         """Handle search input submission (Enter key)"""
         self.search_timer.stop()
         self._emit_search_changed()
     
+    @pyqtSlot(str)
     def _on_filter_changed(self, filter_text: str):
         """Handle filter change"""
         self.filter_changed.emit(filter_text)
     
+    @pyqtSlot()
     def _on_clear_clicked(self):
         """Handle clear button click"""
         self.search_input.clear()
@@ -523,15 +529,7 @@ class EnhancedTreeWidget(QTreeWidget):
                         comp_item = EnhancedTreeWidgetItem(pkg_item, TreeItemType.COMPONENT)
                         
                         # Component icon based on type
-                        if component.component_type.name == 'APPLICATION':
-                            icon = "📱"
-                        elif component.component_type.name == 'COMPOSITION':
-                            icon = "📦"
-                        elif component.component_type.name == 'SERVICE':
-                            icon = "🔧"
-                        else:
-                            icon = "⚙️"
-                        
+                        icon = AppConstants.COMPONENT_ICONS.get(component.component_type.name, AppConstants.DEFAULT_COMPONENT_ICON)
                         comp_item.setText(0, f"{icon} {component.short_name}")
                         comp_item.set_data_object(component)
                         self.all_items.append(comp_item)
@@ -567,8 +565,7 @@ class EnhancedTreeWidget(QTreeWidget):
                 
             except Exception as e:
                 print(f"❌ Failed to add package {package.short_name}: {e}")
-                import traceback
-                traceback.print_exc()
+                self.logger.exception("Failed to add package {}", package.short_name)
         
         print(f"✅ Tree widget populated with {len(self.all_items)} total items")
         print(f"📊 Added {len(added_component_uuids)} unique components")
@@ -593,7 +590,8 @@ class EnhancedTreeWidget(QTreeWidget):
                 for component in sub_pkg.components:
                     try:
                         comp_item = EnhancedTreeWidgetItem(sub_item, TreeItemType.COMPONENT)
-                        comp_item.setText(0, f"⚙️ {component.short_name}")
+                        icon = AppConstants.COMPONENT_ICONS.get(component.component_type.name, AppConstants.DEFAULT_COMPONENT_ICON)
+                        comp_item.setText(0, f"{icon} {component.short_name}")
                         comp_item.set_data_object(component)
                         self.all_items.append(comp_item)
                         
@@ -668,7 +666,8 @@ class EnhancedTreeWidget(QTreeWidget):
     
     def apply_filter(self, filter_text):
         """Apply type filter - FIXED with safe item access"""
-        if filter_text == "All Items":
+        wanted_type = FILTER_ITEM_TYPES.get(filter_text)
+        if wanted_type is None:
             self.clear_search_and_filter()
             return
         
@@ -676,16 +675,8 @@ class EnhancedTreeWidget(QTreeWidget):
             try:
                 if not item.is_valid():
                     continue
-                    
-                show = True
-                if filter_text == "Components Only" and item.item_type != "component":
-                    show = False
-                elif filter_text == "Ports Only" and item.item_type != "port":
-                    show = False
-                elif filter_text == "Packages Only" and item.item_type != "package":
-                    show = False
                 
-                item.setHidden(not show)
+                item.setHidden(item.item_type != wanted_type)
             except RuntimeError:
                 # Qt object was deleted
                 continue
@@ -32,7 +32,8 @@ def setup_application() -> QApplication:
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
         QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
         
-        app = QApplication(sys.argv)
+        # Reuse an existing instance (e.g. when embedded or re-entered)
+        app = QApplication.instance() or QApplication(sys.argv)
         
         # Enhanced application properties
         app.setApplicationName(AppConstants.APP_NAME)
@@ -57,7 +58,7 @@ def setup_application() -> QApplication:
         print(f"❌ Qt Application setup failed: {e}")
         # Try minimal fallback
         try:
-            app = QApplication(sys.argv)
+            app = QApplication.instance() or QApplication(sys.argv)
             app.setApplicationName("ARXML Viewer Pro")
             return app
         except Exception as e2:
@@ -207,6 +207,10 @@ class ARXMLParser:
             'huge_tree': True,
             'remove_blank_text': True,
             'resolve_entities': False,
+            # Comments/PIs carry nothing we read - dropping them at parse time
+            # keeps them out of every iter() walk (and QName() fails on them)
+            'remove_comments': True,
+            'remove_pis': True,
         }
         
         # Enhanced tracking
@@ -238,10 +242,11 @@ class ARXMLParser:
         start_time = time.time()
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        try:
+            self.parse_stats['file_size'] = os.stat(file_path).st_size
+        except FileNotFoundError:
             raise ARXMLParsingError(f"File not found: {file_path}")
         
-        self.parse_stats['file_size'] = file_path.stat().st_size
         self.logger.info(f"Starting COMPREHENSIVE ARXML parsing: {file_path} ({self.parse_stats['file_size']/1024/1024:.1f} MB)")
         
         try:
@@ -672,8 +677,7 @@ class ARXMLParser:
             
         except Exception as e:
             print(f"      ❌ Enhanced prototype parsing failed: {e}")
-            import traceback
-            traceback.print_exc()
+            self.logger.exception("Prototype parsing failed in {}", package_path)
             return None
     
     def _extract_type_reference_enhanced(self, proto_elem: etree.Element, xml_helper: EnhancedXMLHelper) -> str:
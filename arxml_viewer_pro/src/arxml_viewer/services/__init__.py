@@ -7,7 +7,6 @@ Services Module - Search, Filter, and other service components
 try:
     from .search_engine import SearchEngine, SearchScope, SearchMode, SearchResult
     SEARCH_ENGINE_AVAILABLE = True
-    print("✅ Search engine loaded")
 except ImportError as e:
     print(f"⚠️ Search engine not available: {e}")
     SEARCH_ENGINE_AVAILABLE = False
@@ -53,7 +52,6 @@ except ImportError as e:
 try:
     from .filter_manager import FilterManager
     FILTER_MANAGER_AVAILABLE = True
-    print("✅ Filter manager loaded")
 except ImportError as e:
     print(f"⚠️ Filter manager not available: {e}")
     FILTER_MANAGER_AVAILABLE = False
@@ -77,5 +75,3 @@ __all__ = [
     'FilterManager',
     'SEARCH_ENGINE_AVAILABLE', 'FILTER_MANAGER_AVAILABLE'
 ]
-
-print(f"🔧 Services module initialized - Search: {SEARCH_ENGINE_AVAILABLE}, Filter: {FILTER_MANAGER_AVAILABLE}")
\ No newline at end of file
@@ -9,6 +9,9 @@ from typing import List, Dict, Any, Optional
 from enum import Enum
 from dataclasses import dataclass
 
+# Marks a REGEX query that failed to compile - scoring falls back to contains
+_INVALID_REGEX = object()
+
 class SearchScope(str, Enum):
     """Search scope options"""
     ALL = "all"
@@ -142,6 +145,14 @@ class SearchEngine:
         results = []
         query_lower = query.lower().strip()
         
+        # Compile a regex query once for the whole scan, not per item
+        pattern = None
+        if mode == SearchMode.REGEX:
+            try:
+                pattern = re.compile(query_lower)
+            except re.error:
+                pattern = _INVALID_REGEX
+        
         try:
             for item_data in self.indexed_items:
                 # Apply scope filter
@@ -154,7 +165,7 @@ class SearchEngine:
                         continue
                 
                 # Perform text matching
-                match_score = self._calculate_match_score(query_lower, item_data, mode)
+                match_score = self._calculate_match_score(query_lower, item_data, mode, pattern)
                 
                 if match_score > 0:
                     result = SearchResult(
@@ -181,8 +192,10 @@ class SearchEngine:
             print(f"⚠️ Search failed: {e}")
             return []
     
-    def _calculate_match_score(self, query: str, item_data: Dict[str, Any], mode: SearchMode) -> float:
-        """Calculate match score for an item"""
+    def _calculate_match_score(self, query: str, item_data: Dict[str, Any], mode: SearchMode,
+                               pattern: Optional[Any] = None) -> float:
+        """Calculate match score for an item (pattern: precompiled query for REGEX
+        mode, or _INVALID_REGEX; compiled here only if the caller passes none)"""
         try:
             name = item_data['name'].lower()
             searchable_text = item_data['searchable_text']
@@ -212,15 +225,19 @@ class SearchEngine:
                     return 0.5
             
             elif mode == SearchMode.REGEX:
-                try:
-                    if re.search(query, name):
-                        return 0.8
-                    elif re.search(query, searchable_text):
-                        return 0.5
-                except re.error:
+                if pattern is None:
+                    try:
+                        pattern = re.compile(query)
+                    except re.error:
+                        pattern = _INVALID_REGEX
+                if pattern is _INVALID_REGEX:
                     # Invalid regex, fall back to contains
                     if query in name:
                         return 0.7
+                elif pattern.search(name):
+                    return 0.8
+                elif pattern.search(searchable_text):
+                    return 0.5
             
             elif mode == SearchMode.FUZZY:
                 # Simple fuzzy matching - check if most characters match
@@ -46,6 +46,14 @@ class AppConstants:
         'REQUIRED': (211, 47, 47),    # Red
         'PROVIDED_REQUIRED': (255, 193, 7)  # Amber
     }
+    
+    # Tree text indicators per component type name, anything else gets the gear
+    COMPONENT_ICONS = {
+        'APPLICATION': "📱",
+        'COMPOSITION': "📦",
+        'SERVICE': "🔧",
+    }
+    DEFAULT_COMPONENT_ICON = "⚙️"
 
 class UIConstants:
     """UI-specific constants - SIMPLIFIED"""
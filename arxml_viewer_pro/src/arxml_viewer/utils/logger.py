@@ -18,6 +18,14 @@ except ImportError:
     LOGURU_AVAILABLE = False
     loguru_logger = None
 
+def _log(std_logger, level, message, args, kwargs, exc_info=False):
+    """Log with loguru-style lazy {} formatting - skipped if level is filtered"""
+    if not std_logger.isEnabledFor(level):
+        return
+    if args or kwargs:
+        message = str(message).format(*args, **kwargs)
+    std_logger.log(level, message, exc_info=exc_info)
+
 class LoguruFallback:
     """Fallback logger that mimics loguru interface using standard logging"""
     
@@ -73,20 +81,23 @@ class LoguruFallback:
             return BoundLogger(name)
         return self
     
-    def info(self, message):
-        self.logger.info(message)
+    def info(self, message, *args, **kwargs):
+        _log(self.logger, logging.INFO, message, args, kwargs)
+    
+    def debug(self, message, *args, **kwargs):
+        _log(self.logger, logging.DEBUG, message, args, kwargs)
     
-    def debug(self, message):
-        self.logger.debug(message)
+    def warning(self, message, *args, **kwargs):
+        _log(self.logger, logging.WARNING, message, args, kwargs)
     
-    def warning(self, message):
-        self.logger.warning(message)
+    def error(self, message, *args, **kwargs):
+        _log(self.logger, logging.ERROR, message, args, kwargs)
     
-    def error(self, message):
-        self.logger.error(message)
+    def critical(self, message, *args, **kwargs):
+        _log(self.logger, logging.CRITICAL, message, args, kwargs)
     
-    def critical(self, message):
-        self.logger.critical(message)
+    def exception(self, message, *args, **kwargs):
+        _log(self.logger, logging.ERROR, message, args, kwargs, exc_info=True)
 
 class BoundLogger:
     """Bound logger for specific modules"""
@@ -98,20 +109,23 @@ class BoundLogger:
         # Ensure it uses the parent logger's handlers
         self.logger.propagate = True
     
-    def info(self, message):
-        self.logger.info(message)
+    def info(self, message, *args, **kwargs):
+        _log(self.logger, logging.INFO, message, args, kwargs)
+    
+    def debug(self, message, *args, **kwargs):
+        _log(self.logger, logging.DEBUG, message, args, kwargs)
     
-    def debug(self, message):
-        self.logger.debug(message)
+    def warning(self, message, *args, **kwargs):
+        _log(self.logger, logging.WARNING, message, args, kwargs)
     
-    def warning(self, message):
-        self.logger.warning(message)
+    def error(self, message, *args, **kwargs):
+        _log(self.logger, logging.ERROR, message, args, kwargs)
     
-    def error(self, message):
-        self.logger.error(message)
+    def critical(self, message, *args, **kwargs):
+        _log(self.logger, logging.CRITICAL, message, args, kwargs)
     
-    def critical(self, message):
-        self.logger.critical(message)
+    def exception(self, message, *args, **kwargs):
+        _log(self.logger, logging.ERROR, message, args, kwargs, exc_info=True)
 
 # Create the global logger instance
 if LOGURU_AVAILABLE:
@@ -241,10 +255,8 @@ setup_logging(
     enable_console=True
 )
 
-# Print status message
-if LOGURU_AVAILABLE:
-    print("✅ Using loguru for logging")
-else:
+# Only the fallback is worth mentioning - importing a library should be quiet
+if not LOGURU_AVAILABLE:
     print("⚠️ loguru not available, using standard logging fallback")
 
 # Export essential functions